@@ -1,5 +1,6 @@
 """base traces building functions"""
 
+from functools import lru_cache
 from functools import partial
 
 import numpy as np
@@ -22,6 +23,25 @@ received {value!r} instead.
 
 validate_pivot = partial(base_validator, "pivot")
 
+# unit cuboid template (zero in barycenter), scaled by the dimension in `make_Cuboid`
+CUBOID_IJK = np.array(
+    [
+        [7, 0, 0, 0, 4, 4, 2, 6, 4, 0, 3, 7],
+        [0, 7, 1, 2, 6, 7, 1, 2, 5, 5, 2, 2],
+        [3, 4, 2, 3, 5, 6, 5, 5, 0, 1, 7, 6],
+    ]
+)
+CUBOID_XYZ = 0.5 * np.array(
+    [
+        [-1, -1, 1, 1, -1, -1, 1, 1],
+        [-1, 1, 1, -1, -1, 1, 1, -1],
+        [-1, -1, -1, -1, 1, 1, 1, 1],
+    ],
+    dtype=float,
+)
+CUBOID_IJK.setflags(write=False)
+CUBOID_XYZ.setflags(write=False)
+
 
 def get_model(trace, *, backend, show, scale, kwargs):
     """Returns model3d dict depending on backend"""
@@ -93,19 +113,55 @@ def make_Cuboid(
         a 3D-model.
     """
     dimension = np.array(dimension, dtype=float)
-    trace = {
-        "i": np.array([7, 0, 0, 0, 4, 4, 2, 6, 4, 0, 3, 7]),
-        "j": np.array([0, 7, 1, 2, 6, 7, 1, 2, 5, 5, 2, 2]),
-        "k": np.array([3, 4, 2, 3, 5, 6, 5, 5, 0, 1, 7, 6]),
-        "x": np.array([-1, -1, 1, 1, -1, -1, 1, 1]) * 0.5 * dimension[0],
-        "y": np.array([-1, 1, 1, -1, -1, 1, 1, -1]) * 0.5 * dimension[1],
-        "z": np.array([-1, -1, -1, -1, 1, 1, 1, 1]) * 0.5 * dimension[2],
-    }
+    i, j, k = CUBOID_IJK.copy()  # the returned trace is owned by the caller
+    x, y, z = CUBOID_XYZ * dimension[:, np.newaxis]
+    trace = {"i": i, "j": j, "k": k, "x": x, "y": y, "z": z}
 
     trace = place_and_orient_model3d(trace, orientation=orientation, position=position)
     return get_model(trace, backend=backend, show=show, scale=scale, kwargs=kwargs)
 
 
+@lru_cache(maxsize=32)
+def get_unit_prism(base):
+    """Return the vertices, shape (3, 2*base+2), and the triangle indices `i,j,k`, shape
+    (3, 4*base), of a prism with unit diameter and height. Results are cached by `base`
+    and returned read-only."""
+    N = base
+    t = np.linspace(0, 2 * np.pi, N, endpoint=False)
+    c1 = np.array([1 * np.cos(t), 1 * np.sin(t), t * 0 - 1]) * 0.5
+    c2 = np.array([1 * np.cos(t), 1 * np.sin(t), t * 0 + 1]) * 0.5
+    c3 = np.array([[0, 0], [0, 0], [-1, 1]]) * 0.5
+    c = np.concatenate([c1, c2, c3], axis=1)
+    i1 = np.arange(N)
+    j1 = i1 + 1
+    j1[-1] = 0
+    k1 = i1 + N
+
+    i2 = i1 + N
+    j2 = j1 + N
+    j2[-1] = N
+    k2 = i1 + 1
+    k2[-1] = 0
+
+    i3 = i1
+    j3 = j1
+    k3 = i1 * 0 + 2 * N
+
+    i4 = i2
+    j4 = j2
+    k4 = k3 + 1
+
+    # k2&j2 and k3&j3 inverted because of face orientation
+    i = np.concatenate([i1, i2, i3, i4])
+    j = np.concatenate([j1, k2, k3, j4])
+    k = np.concatenate([k1, j2, j3, k4])
+
+    ijk = np.array([i, j, k])
+    c.setflags(write=False)
+    ijk.setflags(write=False)
+    return c, ijk
+
+
 def make_Prism(
     backend="generic",
     base=3,
@@ -159,38 +215,9 @@ def make_Prism(
         A dictionary with necessary key/value pairs with the necessary information to construct
         a 3D-model.
     """
-    N = base
-    t = np.linspace(0, 2 * np.pi, N, endpoint=False)
-    c1 = np.array([1 * np.cos(t), 1 * np.sin(t), t * 0 - 1]) * 0.5
-    c2 = np.array([1 * np.cos(t), 1 * np.sin(t), t * 0 + 1]) * 0.5
-    c3 = np.array([[0, 0], [0, 0], [-1, 1]]) * 0.5
-    c = np.concatenate([c1, c2, c3], axis=1)
-    c = c.T * np.array([diameter, diameter, height])
-    i1 = np.arange(N)
-    j1 = i1 + 1
-    j1[-1] = 0
-    k1 = i1 + N
-
-    i2 = i1 + N
-    j2 = j1 + N
-    j2[-1] = N
-    k2 = i1 + 1
-    k2[-1] = 0
-
-    i3 = i1
-    j3 = j1
-    k3 = i1 * 0 + 2 * N
-
-    i4 = i2
-    j4 = j2
-    k4 = k3 + 1
-
-    # k2&j2 and k3&j3 inverted because of face orientation
-    i = np.concatenate([i1, i2, i3, i4])
-    j = np.concatenate([j1, k2, k3, j4])
-    k = np.concatenate([k1, j2, j3, k4])
-
-    x, y, z = c.T
+    c, ijk = get_unit_prism(base)
+    i, j, k = ijk.copy()  # the returned trace is owned by the caller
+    x, y, z = c * np.array([[diameter], [diameter], [height]])
     trace = {"x": x, "y": y, "z": z, "i": i, "j": j, "k": k}
     trace = place_and_orient_model3d(trace, orientation=orientation, position=position)
     return get_model(trace, backend=backend, show=show, scale=scale, kwargs=kwargs)
@@ -261,19 +288,21 @@ def make_Ellipsoid(
     )
     N2 = len(x) - 1
 
-    i1 = [0] * N
+    i1 = np.zeros(N, dtype=int)
     j1 = np.array([N, *range(1, N)], dtype=int)
     k1 = np.array([*range(1, N), N], dtype=int)
 
-    i2 = np.concatenate([k1 + i * N for i in range(N - 3)])
-    j2 = np.concatenate([j1 + i * N for i in range(N - 3)])
-    k2 = np.concatenate([j1 + (i + 1) * N for i in range(N - 3)])
+    # side faces of all N-3 latitude bands at once, via broadcasting of band offsets
+    offsets = N * np.arange(N - 3)[:, np.newaxis]
+    i2 = (k1 + offsets).ravel()
+    j2 = (j1 + offsets).ravel()
+    k2 = (j1 + offsets + N).ravel()
 
-    i3 = np.concatenate([k1 + i * N for i in range(N - 3)])
-    j3 = np.concatenate([j1 + (i + 1) * N for i in range(N - 3)])
-    k3 = np.concatenate([k1 + (i + 1) * N for i in range(N - 3)])
+    i3 = i2
+    j3 = k2
+    k3 = (k1 + offsets + N).ravel()
 
-    i4 = [N2] * N
+    i4 = np.full(N, N2)
     j4 = k1 + N2 - N - 1
     k4 = j1 + N2 - N - 1
 
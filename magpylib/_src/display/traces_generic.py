@@ -28,6 +28,7 @@ from magpylib._src.display.traces_utility import getColorscale
 from magpylib._src.display.traces_utility import getIntensity
 from magpylib._src.display.traces_utility import group_traces
 from magpylib._src.display.traces_utility import place_and_orient_model3d
+from magpylib._src.display.traces_utility import place_and_orient_model3d_path
 from magpylib._src.display.traces_utility import rescale_traces
 from magpylib._src.display.traces_utility import slice_mesh_from_colorscale
 from magpylib._src.style import DefaultMarkers
@@ -561,14 +562,14 @@ def get_generic_traces3D(
 
     path_traces_generic = []
     for tr in traces_generic:
-        temp_rot_traces = []
         name_suff = tr.pop("name_suffix", None)
         name = tr.get("name", "") if legendtext is None else legendtext
-        for orient, pos in zip(orientations, positions):
-            tr1 = place_and_orient_model3d(tr, orientation=orient, position=pos)
-            if name_suff is not None:
+        temp_rot_traces = place_and_orient_model3d_path(
+            tr, orientations=orientations, positions=positions
+        )
+        if name_suff is not None:
+            for tr1 in temp_rot_traces:
                 tr1["name"] = f"{name}{name_suff}"
-            temp_rot_traces.append(tr1)
         path_traces_generic.extend(group_traces(*temp_rot_traces))
 
     if np.array(input_obj.position).ndim > 1 and style.path.show:
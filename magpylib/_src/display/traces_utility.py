@@ -100,6 +100,28 @@ def place_and_orient_model3d(
     return out[0] if len(out) == 1 else out
 
 
+def place_and_orient_model3d_path(model_kwargs, *, orientations, positions):
+    """places and orients mesh3d dict for all path indices at once. The rotations of
+    all path indices are applied in a single batched operation. Returns a list of
+    model dicts, one per path index."""
+    vertices, coordsargs, _ = get_vertices_from_model(model_kwargs)
+    # sometimes traces come as (n,m,3) shape
+    vert_shape = vertices.shape
+    vertices = np.reshape(vertices.astype(float), (3, -1))
+
+    rotmats = orientations.as_matrix().reshape(-1, 3, 3)
+    positions = np.reshape(np.array(positions, dtype=float), (-1, 3))
+    new_vertices = np.einsum("pij,jn->pin", rotmats, vertices)
+    new_vertices += positions[:, :, np.newaxis]
+
+    traces = []
+    for new_vert in new_vertices:
+        new_vert = np.reshape(new_vert, vert_shape)
+        new_model_dict = {coordsargs[k]: new_vert[i] for i, k in enumerate("xyz")}
+        traces.append({**model_kwargs, **new_model_dict})
+    return traces
+
+
 def get_vertices_from_model(model_kwargs, model_args=None, coordsargs=None):
     """get vertices from model kwargs and args"""
     if model_args:
@@ -516,7 +538,7 @@ def get_scene_ranges(*traces, zoom=0) -> np.ndarray:
             tr = dict(zip("xyz", verts))
             rc = kwex["row"], kwex["col"]
         if rc not in ranges_rc:
-            ranges_rc[rc] = {k: [] for k in "xyz"}
+            ranges_rc[rc] = np.array([[np.inf, -np.inf]] * 3)
             tr_dim_count[rc] = {"2D": 0, "3D": 0}
         if "z" not in tr:  # only extend range for 3d traces
             tr_dim_count[rc]["2D"] += 1
@@ -524,22 +546,25 @@ def get_scene_ranges(*traces, zoom=0) -> np.ndarray:
             tr_dim_count[rc]["3D"] += 1
             pts = np.array([tr[k] for k in coords], dtype="float64").T
             try:  # for mesh3d, use only vertices part of faces for range calculation
-                inds = np.array([tr[k] for k in "ijk"], dtype="int64").T
-                pts = pts[inds]
+                inds = np.array([tr[k] for k in "ijk"], dtype="int64")
+                # mask the used vertices instead of gathering a (nfaces,3,3) array in
+                #    which each vertex is repeated for every face it belongs to
+                used = np.zeros(len(pts), dtype=bool)
+                used[inds] = True
+                pts = pts[used]
             except KeyError:
                 # for 2d meshes, nothing special needed
                 pass
             pts = pts.reshape(-1, 3)
             if pts.size != 0:
-                min_max = np.nanmin(pts, axis=0), np.nanmax(pts, axis=0)
-                for v, min_, max_ in zip(ranges_rc[rc].values(), *min_max):
-                    v.extend([min_, max_])
-    for rc, ranges in ranges_rc.items():
+                # running min/max, np.fmin/np.fmax ignore nan values
+                r = ranges_rc[rc]
+                r[:, 0] = np.fmin(r[:, 0], np.nanmin(pts, axis=0))
+                r[:, 1] = np.fmax(r[:, 1], np.nanmax(pts, axis=0))
+    for rc, r in ranges_rc.items():
         if tr_dim_count[rc]["3D"]:
             zo = zoom[rc] if isinstance(zoom, dict) else zoom
             # SET 3D PLOT BOUNDARIES
-            # collect min/max from all elements
-            r = np.array([[np.nanmin(v), np.nanmax(v)] for v in ranges.values()])
             size = np.diff(r, axis=1)
             m = size.max() / 2
             m = 1 if m == 0 else m
@@ -9,68 +9,178 @@ from scipy.constants import mu_0 as MU0
 
 from magpylib._src.input_checks import check_field_input
 
-
-def vcross3(a: np.ndarray, b: np.ndarray) -> np.ndarray:
-    """
-    vectorized cross product for 3d vectors. Is ~4x faster than np.cross when
-    arrays are smallish. Only slightly faster for large arrays.
-    input shape a,b: (n,3)
-    returns: (n, 3)
-    """
-    # receives nan values at corners
-    with np.errstate(invalid="ignore"):
-        result = np.array(
-            [
-                a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
-                a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
-                a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0],
-            ]
-        )
-    return result.T
+_INV_4PI = 1.0 / (4.0 * np.pi)
+_CHUNK_SIZE = 8192
+_EDGES = ((0, 1), (1, 2), (2, 0))
 
 
-def norm_vector(v) -> np.ndarray:
+def triangle_geometry(v: np.ndarray) -> tuple:
     """
-    Calculates normalized orthogonal vector on a plane defined by three vertices.
+    Calculates the quantities of triangles that do not depend on the observers: the
+    normalized orthogonal vector on the plane defined by the three vertices, and the
+    three edges (0,1), (1,2), (2,0) with their squared and plain lengths.
+    input shape (component-first): v: (3,3,...) as (vertex, xyz, triangle),
+    e.g. (3,3) for a single triangle
+    returns: n components (nx, ny, nz), and for each edge (Lx, Ly, Lz, l2, l, 1/l)
     """
-    a = v[:, 1] - v[:, 0]
-    b = v[:, 2] - v[:, 0]
-    n = vcross3(a, b)
-    n_norm = np.linalg.norm(n, axis=-1)
-    return n / np.expand_dims(n_norm, axis=-1)
-
-
-def solid_angle(R: np.ndarray, r: np.ndarray) -> np.ndarray:
+    ax, ay, az = v[1] - v[0]
+    bx, by, bz = v[2] - v[0]
+    nx = ay * bz - az * by
+    ny = az * bx - ax * bz
+    nz = ax * by - ay * bx
+    inv_norm = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+    nx, ny, nz = nx * inv_norm, ny * inv_norm, nz * inv_norm
+
+    vx, vy, vz = v[:, 0], v[:, 1], v[:, 2]
+    edges = []
+    with np.errstate(divide="ignore"):
+        for i, j in _EDGES:
+            Lx, Ly, Lz = vx[j] - vx[i], vy[j] - vy[i], vz[j] - vz[i]
+            l2 = Lx * Lx + Ly * Ly + Lz * Lz
+            l = np.sqrt(l2)
+            edges.append((Lx, Ly, Lz, l2, l, 1.0 / l))
+    return (nx, ny, nz), edges
+
+
+def solid_angle(R: list, r: list) -> np.ndarray:
     """
     Vectorized computation of the solid angle of triangles.
 
     Triangle point indices are 1,2,3, different triangles are denoted by a,b,c,...
-    The first triangle is defined as R1a, R2a, R3a.
+    The first triangle is defined as R1a, R2a, R3a. Vectors are given component-wise,
+    i.e. R1x = (R1a_x, R1b_x, R1c_x, ...).
 
     Input:
-    R = [(R1a, R1b, R1c, ...), (R2a, R2b, R2c, ...), (R3a, R3b, R3c, ...)]
+    R = [(R1x, R1y, R1z), (R2x, R2y, R2z), (R3x, R3y, R3z)]
     r = [(|R1a|, |R1b|, |R1c|, ...), (|R2a|, |R2b|, |R2c|, ...), (|R3a|, |R3b|, |R3c|, ...)]
 
     Returns:
     [sangle_a, sangle_b, sangle_c, ...]
     """
+    (R1x, R1y, R1z), (R2x, R2y, R2z), (R3x, R3y, R3z) = R
 
     # Calculates (oriented) volume of the parallelepiped in vectorized form.
-    N = np.einsum("ij, ij->i", R[2], vcross3(R[1], R[0]))
+    N = (
+        R3x * (R2y * R1z - R2z * R1y)
+        + R3y * (R2z * R1x - R2x * R1z)
+        + R3z * (R2x * R1y - R2y * R1x)
+    )
 
     D = (
         r[0] * r[1] * r[2]
-        + np.einsum("ij, ij->i", R[2], R[1]) * r[0]
-        + np.einsum("ij, ij->i", R[2], R[0]) * r[1]
-        + np.einsum("ij, ij->i", R[1], R[0]) * r[2]
+        + (R3x * R2x + R3y * R2y + R3z * R2z) * r[0]
+        + (R3x * R1x + R3y * R1y + R3z * R1z) * r[1]
+        + (R2x * R1x + R2y * R1y + R2z * R1z) * r[2]
     )
     result = 2.0 * np.arctan2(N, D)
 
-    # modulus 2pi to avoid jumps on edges in line
-    # "B = sigma * ((n.T * solid_angle(R, r)) - vcross3(n, PQR).T)"
-    # <-- bad fix :(
+    # avoid jumps on edges in line: with N~0 and D<0 arctan2 jumps between +-pi.
+    # The degenerate parallelepiped is set to 0 in-place. The tolerance on N/D
+    # corresponds to the former modulus 2pi fix |result| > 6.2831853.
+    result[(D < 0) & (np.fabs(N) < -3.59e-9 * D)] = 0.0
+
+    return result
 
-    return np.where(abs(result) > 6.2831853, 0, result)
+
+def _triangle_Bfield(
+    observers: np.ndarray,
+    vertices: np.ndarray,
+    polarizations: np.ndarray,
+    geometry: tuple = None,
+) -> np.ndarray:
+    """Core of `triangle_Bfield`, evaluated on a single chunk of the inputs.
+    Inputs are given component-first: observers (3,n), vertices (3,3,n) as
+    (vertex, xyz, triangle) and polarizations (3,n). The triangle and observer axes
+    only need to broadcast against each other, so that quantities that depend only on
+    the triangles (edges, normals) are computed once per triangle. E.g. a single
+    triangle (vertices (3,3), polarizations (3,)) gives scalar vertex and edge
+    components. The output of `triangle_geometry` can be passed as `geometry` when
+    the same triangles are evaluated in several chunks. Returns the B-field
+    component-first with shape (3,n)."""
+    if geometry is None:
+        geometry = triangle_geometry(vertices)
+    (nx, ny, nz), edges = geometry
+    px, py, pz = polarizations
+    # fold 1/4pi into the charge sigma=n*p instead of B
+    sigma = (nx * px + ny * py + nz * pz) * _INV_4PI
+
+    # all vectors are decomposed into contiguous 1D component arrays to avoid
+    #    stacked (3,n,3) intermediates and strided access
+    ox, oy, oz = observers
+    vx, vy, vz = vertices[:, 0], vertices[:, 1], vertices[:, 2]
+
+    # vertex <-> observer
+    R = [(vx[i] - ox, vy[i] - oy, vz[i] - oz) for i in range(3)]
+    r2 = [Rx * Rx + Ry * Ry + Rz * Rz for Rx, Ry, Rz in R]
+    r = [np.sqrt(ri2) for ri2 in r2]
+
+    # The computation of ind is the origin of a major numerical instability
+    #    when approaching the triangle because r ~ -bl. This number
+    #    becomes small at the same rate as it looses precision.
+    #    This is a major problem, because at distances 1e-8 and 1e8 all precision
+    #    is already lost !!!
+    # The second problem is at corner and edge extensions where ind also computes
+    #    as 0. Here one approaches a special case where another evaluation should
+    #    be used. This problem is solved in the following lines by evaluating
+    #    each of the two expressions only where it applies.
+    # np.errstate is still required because the corner evaluation divides by r=0.
+
+    # edge integrals are accumulated one edge at a time into PQR, so that no
+    #    (3,n) or (3,n,3) edge intermediates must be held in memory
+    shape = np.broadcast_shapes(ox.shape, vx.shape[1:])
+    Px, Py, Pz = (np.zeros(shape) for _ in range(3))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, (Lx, Ly, Lz, l2, l, inv_l) in zip((0, 1, 2), edges):
+            # vert-vert -- vert-obs
+            Rx, Ry, Rz = R[i]
+            b = Rx * Lx + Ry * Ly + Rz * Lz
+            bl = b * inv_l
+            # closeness measure to corner and edge, abs taken in-place
+            ind = r[i] + bl
+            np.fabs(ind, out=ind)
+
+            m = ind > 1.0e-12
+            if m.all():
+                # generic case without edge extensions, evaluated in-place in a
+                #    single temporary instead of one temporary per operation
+                I = 2.0 * b
+                I += l2
+                I += r2[i]
+                np.sqrt(I, out=I)
+                I += l
+                I += bl
+                I /= ind
+                np.log(I, out=I)
+                I *= inv_l
+            else:
+                l2 = np.broadcast_to(l2, ind.shape)
+                l = np.broadcast_to(l, ind.shape)
+                inv_l = np.broadcast_to(inv_l, ind.shape)
+                I = np.empty_like(ind)
+                I[m] = inv_l[m] * np.log(
+                    (np.sqrt(l2[m] + 2 * b[m] + r2[i][m]) + l[m] + bl[m]) / ind[m]
+                )
+                m = ~m
+                ri = r[i][m]
+                lr = l[m] - ri
+                np.fabs(lr, out=lr)
+                I[m] = -inv_l[m] * np.log(lr / ri)
+            Px += I * Lx
+            Py += I * Ly
+            Pz += I * Lz
+
+    sa = solid_angle(R, r)
+    # receives nan values at corners
+    with np.errstate(invalid="ignore"):
+        B = sigma * np.array(
+            (
+                nx * sa - (ny * Pz - nz * Py),
+                ny * sa - (nz * Px - nx * Pz),
+                nz * sa - (nx * Py - ny * Px),
+            )
+        )
+
+    return B
 
 
 def triangle_Bfield(
@@ -92,19 +202,22 @@ def triangle_Bfield(
 
     Parameters
     ----------
-    observers: ndarray, shape (n,3)
-        Observer positions (x,y,z) in Cartesian coordinates.
+    observers: ndarray, shape (n,3) or (...,3)
+        Observer positions (x,y,z) in Cartesian coordinates. Arbitrary leading batch
+        axes, e.g. (nframes, nobs, 3), are evaluated in a single pass.
 
-    vertices: ndarray, shape (n,3,3)
+    vertices: ndarray, shape (n,3,3), (...,3,3) or (3,3)
         Triangle vertex positions ((P11,P12,P13), (P21, P22, P23), ...) in Cartesian
-        coordinates.
+        coordinates. Leading axes must match those of `observers`. A single triangle
+        of shape (3,3) is evaluated at all observers without being tiled up, and
+        requires `polarizations` of shape (3,) or (1,3).
 
-    polarizations: ndarray, shape (n,3)
+    polarizations: ndarray, shape (n,3), (...,3) or (3,)
         Magnetic polarization vectors.
 
     Returns
     -------
-    B-field: ndarray, shape (n,3)
+    B-field: ndarray, shape (n,3) or (...,3)
         B-field generated by Triangles at observer positions.
 
     Notes
@@ -114,54 +227,95 @@ def triangle_Bfield(
     Loss of precision when approaching a triangle as (x-edge)**2 :(
     Loss of precision with distance from the triangle as distance**3 :(
     """
-    n = norm_vector(vertices)
-    sigma = np.einsum("ij, ij->i", n, polarizations)  # vectorized inner product
+    # leading batch axes are flattened, so that every intermediate is allocated
+    #    once for the whole batch
+    shape = observers.shape
+    observers = np.reshape(observers, (-1, 3))
+    if vertices.ndim > 2:
+        vertices = np.reshape(vertices, (-1, 3, 3))
+        polarizations = np.reshape(polarizations, (-1, 3))
+    else:
+        polarizations = np.asarray(polarizations)
+        if polarizations.shape == (1, 3):
+            polarizations = polarizations[0]
+        elif polarizations.shape != (3,):
+            raise ValueError(
+                "A single triangle of shape (3,3) requires `polarizations` of shape "
+                f"(3,) or (1,3), instead received shape {polarizations.shape}."
+            )
+
+    # transpose once into a C-contiguous component-first layout, so that all
+    #    component arrays in the computation have unit stride
+    n = len(observers)
+    observers = np.ascontiguousarray(observers.T)
+    if vertices.ndim == 3:
+        vertices = np.ascontiguousarray(vertices.transpose(1, 2, 0))
+        polarizations = np.ascontiguousarray(polarizations.T)
+
+    if n <= _CHUNK_SIZE:
+        return _triangle_Bfield(observers, vertices, polarizations).T.reshape(shape)
+
+    # large inputs are processed in chunks so that the many intermediate arrays
+    #    of one chunk remain cache-resident
+    single = vertices.ndim == 2
+    B = np.empty((n, 3))
+    for start in range(0, n, _CHUNK_SIZE):
+        sl = slice(start, start + _CHUNK_SIZE)
+        if single:
+            B[sl] = _triangle_Bfield(observers[:, sl], vertices, polarizations).T
+        else:
+            B[sl] = _triangle_Bfield(
+                observers[:, sl], vertices[..., sl], polarizations[:, sl]
+            ).T
+    return B.reshape(shape)
+
+
+def triangle_Bfield_mesh(
+    observers: np.ndarray,
+    vertices: np.ndarray,
+    polarizations: np.ndarray,
+) -> np.ndarray:
+    """Magnetic field generated by a set of homogeneously magnetically charged triangular
+    surfaces, summed over all triangles.
 
-    # vertex <-> observer
-    R = np.swapaxes(vertices, 0, 1) - observers
-    r2 = np.sum(R * R, axis=-1)
-    r = np.sqrt(r2)
+    Each observer sees all triangles. The triangle geometry (edges, normals) is
+    computed once per triangle and broadcast against the observers, instead of being
+    recomputed for every observer-triangle pair.
 
-    # vertex <-> vertex
-    L = vertices[:, (1, 2, 0)] - vertices[:, (0, 1, 2)]
-    L = np.swapaxes(L, 0, 1)
-    l2 = np.sum(L * L, axis=-1)
-    l = np.sqrt(l2)
+    Parameters
+    ----------
+    observers: ndarray, shape (n,3)
+        Observer positions (x,y,z) in Cartesian coordinates.
 
-    # vert-vert -- vert-obs
-    b = np.einsum("ijk, ijk->ij", R, L)
-    bl = b / l
-    ind = np.fabs(r + bl)  # closeness measure to corner and edge
+    vertices: ndarray, shape (m,3,3)
+        Vertex positions of the m triangles in Cartesian coordinates.
 
-    # The computation of ind is the origin of a major numerical instability
-    #    when approaching the triangle because r ~ -bl. This number
-    #    becomes small at the same rate as it looses precision.
-    #    This is a major problem, because at distances 1e-8 and 1e8 all precision
-    #    is already lost !!!
-    # The second problem is at corner and edge extensions where ind also computes
-    #    as 0. Here one approaches a special case where another evaluation should
-    #    be used. This problem is solved in the following lines.
-    # np.seterr must be used because of a numpy bug. It does not interpret where
-    #   correctly. The following code will raise a numpy warning - but obviously shouldn't
-    #
-    # x = np.array([(0,1,2), (0,0,1)])
-    # np.where(
-    #     x>0,
-    #     1/x,
-    #     0
-    # )
+    polarizations: ndarray, shape (n,3)
+        Magnetic polarization vectors, one per observer.
 
-    with np.errstate(divide="ignore", invalid="ignore"):
-        I = np.where(
-            ind > 1.0e-12,
-            1.0 / l * np.log((np.sqrt(l2 + 2 * b + r2) + l + bl) / ind),
-            -(1.0 / l) * np.log(np.fabs(l - r) / r),
+    Returns
+    -------
+    B-field: ndarray, shape (n,3)
+        B-field generated by all triangles at observer positions.
+    """
+    n, m = len(observers), len(vertices)
+
+    # component-first layout with observers on axis 1 and triangles on axis 2
+    observers = np.ascontiguousarray(observers.T)[:, :, np.newaxis]
+    polarizations = np.ascontiguousarray(polarizations.T)[:, :, np.newaxis]
+    vertices = np.ascontiguousarray(vertices.transpose(1, 2, 0))[:, :, np.newaxis]
+
+    # chunks of observers so that one chunk holds about _CHUNK_SIZE pairs
+    step = max(1, _CHUNK_SIZE // max(m, 1))
+    geometry = triangle_geometry(vertices)
+    B = np.empty((n, 3))
+    for start in range(0, n, step):
+        sl = slice(start, start + step)
+        B_pairs = _triangle_Bfield(
+            observers[:, sl], vertices, polarizations[:, sl], geometry
         )
-    PQR = np.einsum("ij, ijk -> jk", I, L)
-    B = sigma * (n.T * solid_angle(R, r) - vcross3(n, PQR).T)
-    B = B / np.pi / 4.0
-
-    return B.T
+        B[sl] = np.sum(B_pairs, axis=2).T
+    return B
 
 
 def BHJM_triangle(
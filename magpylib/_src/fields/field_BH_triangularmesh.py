@@ -7,10 +7,18 @@ Computation details in function docstrings.
 # pylint: disable=too-many-branches
 # pylance: disable=Code is unreachable
 import numpy as np
+import scipy.sparse
 import scipy.spatial
 from scipy.constants import mu_0 as MU0
+from scipy.sparse.csgraph import breadth_first_order
+from scipy.sparse.csgraph import connected_components
 
-from magpylib._src.fields.field_BH_triangle import BHJM_triangle
+from magpylib._src.fields.field_BH_triangle import triangle_Bfield
+from magpylib._src.fields.field_BH_triangle import triangle_Bfield_mesh
+
+# observer-face pairs of a mesh below which its field is computed in the shared
+#    tiled call, as the separate broadcast call does not pay off
+_MESH_GROUP_MIN_PAIRS = 2048
 
 
 def calculate_centroid(vertices, faces):
@@ -70,12 +78,12 @@ def v_cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     """
     result = np.array(
         (
-            a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
-            a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
-            a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0],
+            a[..., 1] * b[..., 2] - a[..., 2] * b[..., 1],
+            a[..., 2] * b[..., 0] - a[..., 0] * b[..., 2],
+            a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0],
         )
-    ).T
-    return result
+    )
+    return np.moveaxis(result, 0, -1)
 
 
 def v_dot_cross3d(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
@@ -90,27 +98,77 @@ def v_dot_cross3d(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
     return result
 
 
+def get_unique_vertices(points: np.ndarray) -> tuple:
+    """
+    Return the unique vertices of a triangle soup, and the indices that reconstruct
+    the input points from them.
+
+    Each (x,y,z) point is used as a single 24-byte key, so that the deduplication
+    compares raw bytes instead of lexsorting the float coordinates along axis 0.
+    Negative zeros are turned into positive zeros beforehand, so that both map to
+    the same key. The unique vertices come in order of their first occurrence.
+
+    Input: points: np.ndarray, shape (n,3)
+
+    Output: vertices (m,3), inverse (n,)
+    """
+    # adding 0.0 gives a new contiguous float array with -0.0 replaced by 0.0
+    points = np.asarray(points, dtype=float).reshape(-1, 3) + 0.0
+    keys = points.view(np.dtype((np.void, points.itemsize * 3))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    # relabel the unique keys from key order to first-occurrence order
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return points[first[order]], rank[inverse.ravel()]
+
+
+def get_faces_vertex_graph(faces: np.ndarray) -> tuple:
+    """
+    Return the graph in which each face connects its vertices, as a sparse matrix
+    over consecutive vertex labels (this also handles negative indices), and the
+    faces in terms of these labels.
+    """
+    vertex_inds, faces_inds = np.unique(faces, return_inverse=True)
+    faces_inds = faces_inds.reshape(-1, 3)
+    n = len(vertex_inds)
+    rows = np.concatenate([faces_inds[:, 0], faces_inds[:, 1]])
+    cols = np.concatenate([faces_inds[:, 1], faces_inds[:, 2]])
+    graph = scipy.sparse.coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n)
+    )
+    return graph, faces_inds
+
+
+def is_trimesh_connected(faces: np.ndarray) -> bool:
+    """
+    Check if the faces of a trimesh form a single connected part, without
+    building the faces subsets.
+    """
+    if len(faces) == 0:
+        return True
+    graph, _ = get_faces_vertex_graph(faces)
+    n_parts = connected_components(graph, directed=False, return_labels=False)
+    return n_parts == 1
+
+
 def get_disconnected_faces_subsets(faces: list) -> list:
     """Return a list of disconnected faces sets"""
-    subsets_inds = []
-    tria_temp = faces.copy()
-    while len(tria_temp) > 0:
-        first, *rest = tria_temp
-        first = set(first)
-        lf = -1
-        while len(first) > lf:
-            lf = len(first)
-            rest2 = []
-            for r in rest:
-                if len(first.intersection(set(r))) > 0:
-                    first |= set(r)
-                else:
-                    rest2.append(r)
-            rest = rest2
-        subsets_inds.append(list(first))
-        tria_temp = rest
-    subsets = [faces[np.isin(faces, list(ps)).all(axis=1)] for ps in subsets_inds]
-    return subsets
+    if len(faces) == 0:
+        return []
+    # faces sets are the connected components of the vertex graph
+    graph, faces_inds = get_faces_vertex_graph(faces)
+    _, labels = connected_components(graph, directed=False)
+    faces_labels = labels[faces_inds[:, 0]]
+
+    # order subsets by their first face, keep the faces order within each subset
+    _, first = np.unique(faces_labels, return_index=True)
+    rank = np.empty(labels.max() + 1, dtype=int)
+    rank[faces_labels[np.sort(first)]] = np.arange(len(first))
+    faces_labels = rank[faces_labels]
+    order = np.argsort(faces_labels, kind="stable")
+    split_inds = np.cumsum(np.bincount(faces_labels))[:-1]
+    return np.split(faces[order], split_inds)
 
 
 def get_open_edges(faces: np.ndarray) -> bool:
@@ -123,13 +181,27 @@ def get_open_edges(faces: np.ndarray) -> bool:
     Output: open edges
     """
     edges = np.concatenate([faces[:, 0:2], faces[:, 1:3], faces[:, ::2]], axis=0)
-
-    # unique edge pairs and counts how many
-    edges = np.sort(edges, axis=1)
-    edges_uniq, edge_counts = np.unique(edges, axis=0, return_counts=True)
+    if len(edges) == 0:
+        return np.empty((0, 2), dtype=faces.dtype)
+
+    # encode each undirected edge (lo, hi) as a single int64 key, which sorts like
+    #    the pair itself, so that a 1D sort replaces the lexsort over pairs
+    edges = edges.astype(np.int64)
+    lo = np.minimum(edges[:, 0], edges[:, 1])
+    hi = np.maximum(edges[:, 0], edges[:, 1])
+    shift = lo.min()
+    span = hi.max() - shift + 1
+    keys = np.sort((lo - shift) * span + (hi - shift))
+
+    # unique edge keys and counts how many
+    is_first = np.concatenate(([True], keys[1:] != keys[:-1]))
+    starts = np.flatnonzero(is_first)
+    edge_counts = np.diff(np.append(starts, len(keys)))
 
     # mesh is closed if each edge exists twice
-    return edges_uniq[edge_counts != 2]
+    open_keys = keys[starts[edge_counts != 2]]
+    open_edges = np.stack(divmod(open_keys, span), axis=1) + shift
+    return open_edges.astype(faces.dtype)
 
 
 def fix_trimesh_orientation(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
@@ -195,43 +267,68 @@ def get_inwards_mask(
         Boolean mask of inwards orientations from provided triangles
     """
 
+    n = len(triangles)
     msh = vertices[triangles]
-    mask = np.full(len(triangles), False)
-    indices = list(range(len(triangles)))
-
-    # incrementally add triangles sharing at least a common edge by looping among left over
-    # triangles. If next triangle with common edge is reversed, flip it.
-    any_connected = False
-    while indices:
-        if not any_connected:
-            free_edges = set()
-            is_inwards = is_facet_inwards(msh[indices[0]], msh[indices])
-            mask[indices] = is_inwards
-        for tri_ind in indices:
-            tri = triangles[tri_ind]
-            edges = {(tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])}
-            edges_r = {(tri[1], tri[0]), (tri[2], tri[1]), (tri[0], tri[2])}
-            common = free_edges & edges
-            flip = False
-            if not free_edges:
-                common = True
-            elif common:
-                edges = edges_r
-                flip = True
-            else:
-                common = free_edges & edges_r
-            if common:  # break loop on first common edge found
-                free_edges ^= edges
-                if flip:
-                    mask[tri_ind] = not mask[tri_ind]
-                indices.remove(tri_ind)
-                any_connected = True
-                break
-        else:
-            # if loop reaches the end and does not find any connected edge, while still
-            # having some indices to go trough -> mesh is is disconnected. A new seed is
-            # needed and needs to be checked via ray tracing before continuing.
-            any_connected = False
+    mask = np.full(n, False)
+    if n == 0:
+        return mask
+
+    # directed edges (start -> end) of all triangles, with their triangle index
+    start = triangles.ravel().astype(np.int64)
+    end = triangles[:, [1, 2, 0]].ravel().astype(np.int64)
+    tri_inds = np.repeat(np.arange(n), 3)
+    valid = start != end
+    start, end, tri_inds = start[valid], end[valid], tri_inds[valid]
+    forward = start < end
+
+    # pair up triangles sharing an edge, via sorted single int64 undirected edge keys
+    lo, hi = np.minimum(start, end), np.maximum(start, end)
+    keys = (lo - lo.min()) * (hi.max() - lo.min() + 1) + (hi - lo.min())
+    order = np.argsort(keys, kind="stable")
+    keys, tri_inds, forward = keys[order], tri_inds[order], forward[order]
+    shared = (keys[1:] == keys[:-1]) & (tri_inds[1:] != tri_inds[:-1])
+    t1, t2 = tri_inds[:-1][shared], tri_inds[1:][shared]
+    # neighbors are consistently oriented if they traverse their common edge in
+    #    opposite directions, otherwise one of them must be flipped relative to the other
+    rel_flip = forward[:-1][shared] == forward[1:][shared]
+    pair_keys, first = np.unique(
+        np.minimum(t1, t2) * n + np.maximum(t1, t2), return_index=True
+    )
+    t1, t2, rel_flip = t1[first], t2[first], rel_flip[first]
+    graph = scipy.sparse.coo_matrix(
+        (np.ones(len(t1), dtype=np.int8), (t1, t2)), shape=(n, n)
+    ).tocsr()
+
+    # edge-connected parts are processed in the order of their first triangle. The
+    #    first triangle is a seed, which is oriented via ray tracing against the
+    #    triangles of all parts which have not been processed yet.
+    _, labels = connected_components(graph, directed=False)
+    _, seeds = np.unique(labels, return_index=True)
+    seeds = np.sort(seeds)
+    label_rank = np.empty(len(seeds), dtype=int)
+    label_rank[labels[seeds]] = np.arange(len(seeds))
+    tri_rank = label_rank[labels]
+
+    # orientation of each triangle relative to its seed, by accumulating the relative
+    #    flips along the breadth-first trees with pointer jumping
+    parent = np.arange(n)
+    for seed in seeds:
+        inds, preds = breadth_first_order(
+            graph, seed, directed=False, return_predecessors=True
+        )
+        parent[inds[1:]] = preds[inds[1:]]
+    child = np.flatnonzero(parent != np.arange(n))
+    child_keys = np.minimum(child, parent[child]) * n + np.maximum(child, parent[child])
+    parity = np.full(n, False)
+    parity[child] = rel_flip[np.searchsorted(pair_keys, child_keys)]
+    while np.any(parent != parent[parent]):
+        parity ^= parity[parent]
+        parent = parent[parent]
+
+    for rank, seed in enumerate(seeds):
+        is_inwards = is_facet_inwards(msh[seed], msh[tri_rank >= rank])
+        part = tri_rank == rank
+        mask[part] = is_inwards ^ parity[part]
     return mask
 
 
@@ -249,9 +346,10 @@ def lines_end_in_trimesh(lines: np.ndarray, faces: np.ndarray) -> np.ndarray:
         n line segements defined through respectively 2 (first index) positions with
         coordinates (x,y,z) (last index). The first point must lie outside of the mesh.
 
-    faces: ndarray, shape (m,3,3)
+    faces: ndarray, shape (m,3,3) or (n,m,3,3)
         m faces defined through respectively 3 (first index) positions with coordinates
-        (x,y,z) (last index). The faces must define a closed mesh.
+        (x,y,z) (last index). The faces must define a closed mesh. With shape (n,m,3,3)
+        each line is checked against its own mesh.
 
     Returns
     -------
@@ -270,8 +368,9 @@ def lines_end_in_trimesh(lines: np.ndarray, faces: np.ndarray) -> np.ndarray:
     """
 
     # Part 1 ---------------------------
-    normals = v_cross(faces[:, 0] - faces[:, 2], faces[:, 1] - faces[:, 2])
-    normals = np.tile(normals, (len(lines), 1, 1))
+    f0, f1, f2 = faces[..., 0, :], faces[..., 1, :], faces[..., 2, :]
+    shape = (len(lines), faces.shape[-3], 3)
+    normals = np.broadcast_to(v_cross(f0 - f2, f1 - f2), shape)
 
     l0 = lines[:, 0][:, np.newaxis]  # outside points
     l1 = lines[:, 1][:, np.newaxis]  # possible inside test-points
@@ -279,14 +378,12 @@ def lines_end_in_trimesh(lines: np.ndarray, faces: np.ndarray) -> np.ndarray:
     # test-point might coincide with chosen in-plane reference point (chosen faces[:,2] here).
     # this then leads to bad projection computation
     # --> choose other reference points (faces[:,1]) in those specific cases
-    ref_pts = np.tile(faces[:, 2], (len(lines), 1, 1))
+    ref_pts = np.broadcast_to(f2, shape)
     eps = 1e-16  # note: norm square !
     coincide = v_norm2(l1 - ref_pts) < eps
     if np.any(coincide):
-        ref_pts2 = np.tile(
-            faces[:, 1], (len(lines), 1, 1)
-        )  # <--inefficient tile !!! only small part needed
-        ref_pts[coincide] = ref_pts2[coincide]
+        ref_pts = ref_pts.copy()
+        ref_pts[coincide] = np.broadcast_to(f1, shape)[coincide]
 
     proj0 = v_norm_proj(l0 - ref_pts, normals)
     proj1 = v_norm_proj(l1 - ref_pts, normals)
@@ -303,9 +400,9 @@ def lines_end_in_trimesh(lines: np.ndarray, faces: np.ndarray) -> np.ndarray:
 
     # Part 2 ---------------------------
     # signed areas (no 0-problem because ss0 is the outside point)
-    a = faces[:, 0] - l0
-    b = faces[:, 1] - l0
-    c = faces[:, 2] - l0
+    a = f0 - l0
+    b = f1 - l0
+    c = f2 - l0
     d = l1 - l0
     area1 = v_dot_cross3d(a, b, d)
     area2 = v_dot_cross3d(b, c, d)
@@ -439,22 +536,17 @@ def mask_inside_enclosing_box(points: np.ndarray, vertices: np.ndarray) -> np.nd
     Parameters
     ----------
     points, ndarray, shape (n,3)
-    vertices, ndarray, shape (m,3)
+    vertices, ndarray, shape (m,3), or (n,m,3) with one mesh per point
 
     Returns
     -------
     ndarray, boolean, shape (n,)
     """
-    xmin, ymin, zmin = np.min(vertices, axis=0)
-    xmax, ymax, zmax = np.max(vertices, axis=0)
-    x, y, z = points.T
+    vmin = np.min(vertices, axis=-2)
+    vmax = np.max(vertices, axis=-2)
 
     eps = 1e-12
-    mx = (x < xmax + eps) & (x > xmin - eps)
-    my = (y < ymax + eps) & (y > ymin - eps)
-    mz = (z < zmax + eps) & (z > zmin - eps)
-
-    return mx & my & mz
+    return np.all((points < vmax + eps) & (points > vmin - eps), axis=-1)
 
 
 def mask_inside_trimesh(points: np.ndarray, faces: np.ndarray) -> np.ndarray:
@@ -464,7 +556,7 @@ def mask_inside_trimesh(points: np.ndarray, faces: np.ndarray) -> np.ndarray:
     Parameters
     ----------
     points, ndarray, shape (n,3)
-    faces, ndarray, shape (m,3,3)
+    faces, ndarray, shape (m,3,3), or (n,m,3,3) with one mesh per point
 
     Returns
     -------
@@ -475,17 +567,21 @@ def mask_inside_trimesh(points: np.ndarray, faces: np.ndarray) -> np.ndarray:
     Method: ray-tracing.
     Faces must form a closed mesh for this to work.
     """
-    vertices = faces.reshape((-1, 3))
+    vertices = faces.reshape((*faces.shape[:-3], -1, 3))
 
     # test-points inside of enclosing box
     mask_inside = mask_inside_enclosing_box(points, vertices)
     pts_in_box = points[mask_inside]
 
     # create test-lines from outside to test-points
-    start_point_outside = np.min(vertices, axis=0) - np.array(
+    start_point_outside = np.min(vertices, axis=-2) - np.array(
         [12.0012345, 5.9923456, 6.9932109]
     )
-    test_lines = np.tile(start_point_outside, (len(pts_in_box), 2, 1))
+    if faces.ndim == 4:
+        start_point_outside = start_point_outside[mask_inside]
+        faces = faces[mask_inside]
+    test_lines = np.empty((len(pts_in_box), 2, 3))
+    test_lines[:, 0] = start_point_outside
     test_lines[:, 1] = pts_in_box
 
     # check if test-points are inside using ray tracing
@@ -496,6 +592,60 @@ def mask_inside_trimesh(points: np.ndarray, faces: np.ndarray) -> np.ndarray:
     return mask_inside
 
 
+def get_mesh_groups(mesh: np.ndarray) -> list:
+    """
+    Return (start, end) index pairs of the runs of consecutive identical meshes.
+
+    Input: mesh: np.ndarray, shape (n,m,3,3), or object array of shape (n,) holding
+        meshes with different numbers of faces
+
+    Output: list of (start, end) tuples
+    """
+    if len(mesh) == 0:
+        return []
+    if mesh.ndim != 1:
+        is_new = np.any(mesh[1:] != mesh[:-1], axis=(1, 2, 3))
+    else:
+        is_new = np.array(
+            [
+                m1.shape != m0.shape or np.any(m1 != m0)
+                for m0, m1 in zip(mesh[:-1], mesh[1:])
+            ],
+            dtype=bool,
+        )
+    bounds = np.flatnonzero(is_new) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(mesh)]))
+    return list(zip(starts, ends))
+
+
+def _trimesh_Bfield_tiled(
+    observers: np.ndarray, mesh: np.ndarray, polarization: np.ndarray
+) -> np.ndarray:
+    """
+    Return the B-field of n meshes at n observers by tiling observers and polarizations
+    over the faces of their mesh, and summing the face fields of each mesh.
+
+    Input: observers: shape (n,3), mesh: shape (n,m,3,3) or object array of shape (n,)
+        holding meshes with different numbers of faces, polarization: shape (n,3)
+
+    Output: np.ndarray, shape (n,3)
+    """
+    if mesh.ndim != 1:  # all meshes have the same number of faces
+        nvs = mesh.shape[1]
+        vertices_tiled = mesh.reshape(-1, 3, 3)
+    else:
+        nvs = np.array([f.shape[0] for f in mesh])
+        vertices_tiled = np.concatenate([f.reshape((-1, 3, 3)) for f in mesh])
+    B = triangle_Bfield(
+        observers=np.repeat(observers, nvs, axis=0),
+        vertices=vertices_tiled,
+        polarizations=np.repeat(polarization, nvs, axis=0),
+    )
+    starts = np.arange(len(observers)) * nvs if mesh.ndim != 1 else np.cumsum(nvs) - nvs
+    return np.add.reduceat(B, starts, axis=0)
+
+
 def BHJM_magnet_trimesh(
     field: str,
     observers: np.ndarray,
@@ -508,59 +658,46 @@ def BHJM_magnet_trimesh(
     - Closed meshes are assumed (input comes only from TriangularMesh class)
     - Field computations via publication: Guptasarma: GEOPHYSICS 1999 64:1, 70-74
     """
+    # consecutive observers that see the same mesh are evaluated together, so that
+    #    the face geometry is computed only once per mesh
+    groups = get_mesh_groups(mesh) if field in "BH" or in_out == "auto" else []
+
+    # small groups (e.g. many distinct magnets with few observers) do not amortize
+    #    a call each, and are evaluated together with one mesh per observer
+    small, large = [], []
+    for start, end in groups:
+        is_small = (end - start) * len(mesh[start]) < _MESH_GROUP_MIN_PAIRS
+        (small if is_small else large).append((start, end))
+    if small:
+        inds = np.concatenate([np.arange(start, end) for start, end in small])
+        mesh_small = mesh[inds]
+
+    BHJM = np.zeros_like(observers, dtype=float)
     if field in "BH":
-        if mesh.ndim != 1:  # all vertices objects have same number of children
-            n0, n1, *_ = mesh.shape
-            vertices_tiled = mesh.reshape(-1, 3, 3)
-            observers_tiled = np.repeat(observers, n1, axis=0)
-            polarization_tiled = np.repeat(polarization, n1, axis=0)
-            BHJM = BHJM_triangle(
-                field="B",
-                observers=observers_tiled,
-                vertices=vertices_tiled,
-                polarization=polarization_tiled,
+        for start, end in large:
+            BHJM[start:end] = triangle_Bfield_mesh(
+                observers=observers[start:end],
+                vertices=mesh[start].reshape((-1, 3, 3)),
+                polarizations=polarization[start:end],
             )
-            BHJM = BHJM.reshape((n0, n1, 3))
-            BHJM = np.sum(BHJM, axis=1)
-        else:
-            nvs = [f.shape[0] for f in mesh]  # length of vertex set
-            split_indices = np.cumsum(nvs)[:-1]  # remove last to avoid empty split
-            vertices_tiled = np.concatenate([f.reshape((-1, 3, 3)) for f in mesh])
-            observers_tiled = np.repeat(observers, nvs, axis=0)
-            polarization_tiled = np.repeat(polarization, nvs, axis=0)
-            BHJM = BHJM_triangle(
-                field="B",
-                observers=observers_tiled,
-                vertices=vertices_tiled,
-                polarization=polarization_tiled,
+        if small:
+            BHJM[inds] = _trimesh_Bfield_tiled(
+                observers[inds], mesh_small, polarization[inds]
             )
-            b_split = np.split(BHJM, split_indices)
-            BHJM = np.array([np.sum(bh, axis=0) for bh in b_split])
-    else:
-        BHJM = np.zeros_like(observers, dtype=float)
 
     if field == "H":
         return BHJM / MU0
 
     if in_out == "auto":
-        prev_ind = 0
-        # group similar meshes for inside-outside evaluation and adding B
-        for new_ind, _ in enumerate(BHJM):
-            if (
-                new_ind == len(BHJM) - 1
-                or mesh[new_ind].shape != mesh[prev_ind].shape
-                or not np.all(mesh[new_ind] == mesh[prev_ind])
-            ):
-                if new_ind == len(BHJM) - 1:
-                    new_ind = len(BHJM)
-                mask_inside = mask_inside_trimesh(
-                    observers[prev_ind:new_ind], mesh[prev_ind]
-                )
-                # if inside magnet add polarization vector
-                BHJM[prev_ind:new_ind][mask_inside] += polarization[prev_ind:new_ind][
-                    mask_inside
-                ]
-                prev_ind = new_ind
+        # meshes with differing numbers of faces cannot be stacked for the ray-tracing
+        batched = bool(small) and mesh.ndim != 1
+        for start, end in large if batched else groups:
+            mask_inside = mask_inside_trimesh(observers[start:end], mesh[start])
+            # if inside magnet add polarization vector
+            BHJM[start:end][mask_inside] += polarization[start:end][mask_inside]
+        if batched:
+            inside = inds[mask_inside_trimesh(observers[inds], mesh_small)]
+            BHJM[inside] += polarization[inside]
     elif in_out == "inside":
         BHJM += polarization
 
@@ -13,6 +13,9 @@ from magpylib._src.fields.field_BH_triangularmesh import fix_trimesh_orientation
 from magpylib._src.fields.field_BH_triangularmesh import get_disconnected_faces_subsets
 from magpylib._src.fields.field_BH_triangularmesh import get_intersecting_triangles
 from magpylib._src.fields.field_BH_triangularmesh import get_open_edges
+from magpylib._src.fields.field_BH_triangularmesh import get_unique_vertices
+from magpylib._src.fields.field_BH_triangularmesh import is_trimesh_connected
+from magpylib._src.input_checks import check_array_shape
 from magpylib._src.input_checks import check_format_input_vector
 from magpylib._src.input_checks import check_format_input_vector2
 from magpylib._src.obj_classes.class_BaseExcitations import BaseMagnet
@@ -141,6 +144,8 @@ class TriangularMesh(BaseMagnet):
         self._status_disconnected_data = None
         self._status_open_data = None
         self._status_selfintersecting_data = None
+        self._mesh_cache = None
+        self._centroid_cache = None
 
         self.check_open(mode=check_open)
         self.check_disconnected(mode=check_disconnected)
@@ -166,7 +171,17 @@ class TriangularMesh(BaseMagnet):
     @property
     def mesh(self):
         """Mesh"""
-        return self._vertices[self._faces]
+        # the (n,3,3) mesh is only rebuilt when vertices or faces are replaced
+        cache = self._mesh_cache
+        if (
+            cache is None
+            or cache[0] is not self._vertices
+            or cache[1] is not self._faces
+        ):
+            mesh = self._vertices[self._faces]
+            mesh.flags.writeable = False
+            self._mesh_cache = cache = (self._vertices, self._faces, mesh)
+        return cache[2]
 
     @property
     def status_open(self):
@@ -279,6 +294,11 @@ class TriangularMesh(BaseMagnet):
         """
         mode = self._validate_mode_arg(mode, arg_name="check_disconnected mode")
         if mode != "skip" and self._status_disconnected is None:
+            if self._status_disconnected_data is None and is_trimesh_connected(
+                self._faces
+            ):
+                # connected mesh, the only faces subset is the mesh itself
+                self._status_disconnected_data = [self._faces]
             self._status_disconnected = len(self.get_faces_subsets()) > 1
             if self._status_disconnected:
                 msg = (
@@ -392,7 +412,9 @@ class TriangularMesh(BaseMagnet):
                 elif mode == "raise":
                     raise ValueError(msg)
 
-            self._faces = fix_trimesh_orientation(self._vertices, self._faces)
+            faces = fix_trimesh_orientation(self._vertices, self._faces)
+            faces.flags.writeable = False
+            self._faces = faces
             self._status_reoriented = True
 
     def get_faces_subsets(self):
@@ -459,12 +481,24 @@ class TriangularMesh(BaseMagnet):
         """return self-intersecting faces"""
         return self._status_selfintersecting_data
 
+    @property
+    def _centroid(self):
+        """Mesh centroid in the local object coordinates."""
+        # the centroid is only recomputed when vertices or faces are replaced
+        cache = self._centroid_cache
+        if (
+            cache is None
+            or cache[0] is not self._vertices
+            or cache[1] is not self._faces
+        ):
+            centroid = calculate_centroid(self._vertices, self._faces)
+            self._centroid_cache = cache = (self._vertices, self._faces, centroid)
+        return cache[2]
+
     @property
     def _barycenter(self):
         """Object barycenter."""
-        return self._get_barycenter(
-            self._position, self._orientation, self._vertices, self._faces
-        )
+        return self._get_barycenter(self._position, self._orientation, self._centroid)
 
     @property
     def barycenter(self):
@@ -472,13 +506,8 @@ class TriangularMesh(BaseMagnet):
         return np.squeeze(self._barycenter)
 
     @staticmethod
-    def _get_barycenter(position, orientation, vertices, faces):
-        """Returns the barycenter of a tetrahedron."""
-        centroid = (
-            np.array([0.0, 0.0, 0.0])
-            if vertices is None
-            else calculate_centroid(vertices, faces)
-        )
+    def _get_barycenter(position, orientation, centroid):
+        """Returns the barycenter of a triangular mesh from its local centroid."""
         barycenter = orientation.apply(centroid) + position
         return barycenter
 
@@ -499,29 +528,56 @@ class TriangularMesh(BaseMagnet):
             sig_name="TriangularMesh.vertices",
             sig_type="array_like (list, tuple, ndarray) of shape (n,3)",
         )
-        trias = check_format_input_vector(
-            faces,
-            dims=(2,),
-            shape_m1=3,
-            sig_name="TriangularMesh.faces",
-            sig_type="array_like (list, tuple, ndarray) of shape (n,3)",
-        ).astype(int)
-        try:
-            verts[trias]
-        except IndexError as e:
-            raise IndexError(
-                "Some `faces` indices do not match with `vertices` array"
-            ) from e
+        if isinstance(faces, np.ndarray) and faces.dtype.kind in "iu":
+            # integer arrays (e.g. from pyvista or scipy) skip the float conversion,
+            #    they are always copied since mesh and centroid are cached by identity
+            check_array_shape(
+                faces,
+                dims=(2,),
+                shape_m1=3,
+                msg=(
+                    "Input parameter `TriangularMesh.faces` must be array_like (list, "
+                    "tuple, ndarray) of shape (n,3).\n"
+                    f"Instead received array_like with shape {faces.shape}."
+                ),
+            )
+            trias = faces.astype(np.intp)
+        else:
+            trias = check_format_input_vector(
+                faces,
+                dims=(2,),
+                shape_m1=3,
+                sig_name="TriangularMesh.faces",
+                sig_type="array_like (list, tuple, ndarray) of shape (n,3)",
+            ).astype(np.intp)
+        # bounds check without gathering the (n,3,3) mesh
+        n = len(verts)
+        if trias.size and (trias.min() < -n or trias.max() >= n):
+            raise IndexError("Some `faces` indices do not match with `vertices` array")
+        # stored read-only, so that mesh and centroid caches cannot go stale through
+        #    in-place edits of the arrays returned by the getters
+        verts.flags.writeable = False
+        trias.flags.writeable = False
         return verts, trias
 
     def to_TriangleCollection(self):
         """Return a Collection of Triangle objects from the current TriangularMesh"""
-        tris = [Triangle(polarization=self.polarization, vertices=v) for v in self.mesh]
-        coll = Collection(tris)
-        coll.position = self.position
-        coll.orientation = self.orientation
-        # pylint: disable=no-member
-        coll.style.update(self.style.as_dict(), _match_properties=False)
+        # pylint: disable=protected-access
+        # Triangles are created directly in the pose of the mesh from the validated
+        #    mesh data, instead of moving and rotating each child with the Collection
+        pos, ori, pol = self._position, self._orientation, self._polarization
+        tris = [
+            Triangle._from_validated(
+                pos.copy(), ori, v, None if pol is None else pol.copy()
+            )
+            for v in np.array(self.mesh)
+        ]
+        coll = Collection(tris, position=pos, orientation=ori)
+        # an untouched mesh style holds only defaults, which the Collection style
+        #    already has, and is neither created nor copied
+        if getattr(self, "_style", None) is not None or self._style_kwargs:
+            # pylint: disable=no-member
+            coll.style.update(self.style.as_dict(), _match_properties=False)
         return coll
 
     @classmethod
@@ -594,7 +650,8 @@ class TriangularMesh(BaseMagnet):
         Notes
         -----
         Faces are automatically reoriented since `scipy.spatial.ConvexHull` objects do not
-        guarantee that the faces are all pointing outwards. A mesh validation is also performed.
+        guarantee that the faces are all pointing outwards. The orientation is taken from
+        the outward facet normals of the hull. A mesh validation is also performed.
 
         Returns
         -------
@@ -603,19 +660,47 @@ class TriangularMesh(BaseMagnet):
         Examples
         --------
         """
-        return cls(
+        # pylint: disable=protected-access
+        # a convex hull is closed and connected by construction, the corresponding
+        #    mesh checks are skipped and their status set directly
+        check_open = cls._validate_mode_arg(check_open, arg_name="check_open mode")
+        check_disconnected = cls._validate_mode_arg(
+            check_disconnected, arg_name="check_disconnected mode"
+        )
+        reorient_faces = cls._validate_mode_arg(
+            reorient_faces, arg_name="reorient_faces mode"
+        )
+        hull = ConvexHull(points)
+        faces = hull.simplices
+        if reorient_faces != "skip":
+            # the hull facet equations hold outward normals, faces whose vertex order
+            #    yields an opposing normal are flipped
+            tri = hull.points[faces]
+            normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+            flip = np.einsum("ij,ij->i", normals, hull.equations[:, :3]) < 0
+            faces[flip] = faces[flip][:, [0, 2, 1]]
+        obj = cls(
             position=position,
             orientation=orientation,
             vertices=points,
-            faces=ConvexHull(points).simplices,
+            faces=faces,
             polarization=polarization,
             magnetization=magnetization,
-            reorient_faces=reorient_faces,
-            check_open=check_open,
-            check_disconnected=check_disconnected,
+            reorient_faces="skip",
+            check_open="skip",
+            check_disconnected="skip",
             style=style,
             **kwargs,
         )
+        # a skipped check leaves its status unset, as with the other constructors
+        if check_open != "skip":
+            obj._status_open = False
+            obj._status_open_data = np.empty((0, 2), dtype=obj._faces.dtype)
+        obj._status_reoriented = reorient_faces != "skip"
+        if check_disconnected != "skip":
+            obj._status_disconnected = False
+            obj._status_disconnected_data = [obj._faces]
+        return obj
 
     @classmethod
     def from_pyvista(
@@ -711,7 +796,12 @@ class TriangularMesh(BaseMagnet):
             )
         polydata = polydata.triangulate()
         vertices = polydata.points
-        faces = polydata.faces.reshape(-1, 4)[:, 1:]
+        if hasattr(polydata, "regular_faces"):
+            # pyvista>=0.43, (n,3) faces from the connectivity array, avoids building
+            #    the legacy padded faces array
+            faces = polydata.regular_faces
+        else:  # pragma: no cover
+            faces = polydata.faces.reshape(-1, 4)[:, 1:]
 
         return cls(
             position=position,
@@ -811,14 +901,16 @@ class TriangularMesh(BaseMagnet):
                 "The `triangles` parameter must be a list or Collection of `Triangle` objects, "
                 f"\nreceived type {type(triangles)} instead"
             )
-        for obj in triangles:
+        # type check and gather of the vertices into a preallocated mesh in one pass
+        mesh = np.empty((len(triangles), 3, 3))
+        for i, obj in enumerate(triangles):
             if not isinstance(obj, Triangle):
                 raise TypeError(
                     "All elements of `triangles` must be `Triangle` objects, "
                     f"\nreceived type {type(obj)} instead"
                 )
-        mesh = np.array([tria.vertices for tria in triangles])
-        vertices, tr = np.unique(mesh.reshape((-1, 3)), axis=0, return_inverse=True)
+            mesh[i] = obj.vertices
+        vertices, tr = get_unique_vertices(mesh.reshape((-1, 3)))
         faces = tr.reshape((-1, 3))
 
         return cls(
@@ -919,7 +1011,7 @@ class TriangularMesh(BaseMagnet):
             shape=[None, 3, 3],
             param_name="mesh",
         )
-        vertices, tr = np.unique(mesh.reshape((-1, 3)), axis=0, return_inverse=True)
+        vertices, tr = get_unique_vertices(mesh.reshape((-1, 3)))
         faces = tr.reshape((-1, 3))
 
         return cls(
@@ -123,6 +123,28 @@ class Triangle(BaseMagnet):
             position, orientation, magnetization, polarization, style, **kwargs
         )
 
+    @classmethod
+    def _from_validated(cls, position, orientation, vertices, polarization):
+        """Fast constructor from already validated and formatted inputs, skipping
+        all input checks. Used to create many Triangles at once, e.g. from a mesh.
+
+        position: ndarray, shape (m,3)
+        orientation: scipy Rotation object of length m
+        vertices: ndarray, shape (3,3)
+        polarization: ndarray, shape (3,) or None
+        """
+        obj = cls.__new__(cls)
+        obj._style_kwargs = {}
+        obj._parent = None
+        obj._position = position
+        obj._orientation = orientation
+        obj._vertices = vertices
+        obj._polarization = polarization
+        obj._magnetization = (
+            None if polarization is None else polarization / (4 * np.pi * 1e-7)
+        )
+        return obj
+
     # property getters and setters
     @property
     def vertices(self):
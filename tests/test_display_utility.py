@@ -5,10 +5,13 @@ import numpy as np
 import plotly
 import pytest
 import pyvista
+from scipy.spatial.transform import Rotation as R
 
 import magpylib as magpy
 from magpylib._src.display.traces_utility import draw_arrow_from_vertices
 from magpylib._src.display.traces_utility import merge_scatter3d
+from magpylib._src.display.traces_utility import place_and_orient_model3d
+from magpylib._src.display.traces_utility import place_and_orient_model3d_path
 from magpylib._src.exceptions import MagpylibBadUserInput
 
 
@@ -101,3 +104,39 @@ def test_merge_scatter3d():
 
     merge_scatter3d(*get_traces(1))
     merge_scatter3d(*get_traces(3))
+
+
+def test_place_and_orient_model3d_path():
+    """batched path placement must match per-index placement"""
+    trace = {
+        "type": "mesh3d",
+        "x": np.array([0.0, 1.0, 0.0]),
+        "y": np.array([0.0, 0.0, 1.0]),
+        "z": np.array([0.0, 0.0, 0.0]),
+        "i": [0],
+        "j": [1],
+        "k": [2],
+    }
+    rots = R.from_rotvec([(0, 0, 0), (0.1, 0.2, 0.3), (-1, 2, 0.5)])
+    poss = np.array([(0, 0, 0), (1, 2, 3), (-1, 0, 5)])
+
+    traces = place_and_orient_model3d_path(trace, orientations=rots, positions=poss)
+    assert len(traces) == 3
+    for tr, rot, pos in zip(traces, rots, poss):
+        tr_ref = place_and_orient_model3d(trace, orientation=rot, position=pos)
+        assert tr.keys() == tr_ref.keys()
+        for k in "xyz":
+            np.testing.assert_allclose(tr[k], tr_ref[k])
+
+
+@pytest.mark.parametrize(
+    "make_model",
+    [magpy.graphics.model3d.make_Cuboid, magpy.graphics.model3d.make_Prism],
+)
+def test_model3d_trace_is_writable(make_model):
+    """returned traces are owned by the caller and do not alias the cached templates"""
+    trace = make_model()["kwargs"]
+    for key in "ijkxyz":
+        trace[key][0] = 99
+    trace = make_model()["kwargs"]
+    assert all(trace[key][0] != 99 for key in "ijkxyz")
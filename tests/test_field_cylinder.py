@@ -192,40 +192,53 @@ np.save(os.path.join(folder, "tests/testdata/testdata_cy_cases"), DATA) """
 DATA = np.load("tests/testdata/testdata_cy_cases.npy", allow_pickle=True).item()
 
 
+@pytest.fixture(scope="module")
+def cylinder_tile_H():
+    """H-field of all precomputed cylinder test cases, stacked into a single
+    kernel call and split back into shape (n_cases, n, 3)"""
+    inputs = [v["inputs"] for v in DATA.values()]
+    H = magnet_cylinder_segment_Hfield(
+        magnetizations=np.concatenate([inp["mag"] for inp in inputs]),
+        observers=np.concatenate([inp["obs_pos"] for inp in inputs]),
+        dimensions=np.concatenate([inp["dim"] for inp in inputs]),
+    )
+    H = H / 4 / np.pi * 1e7  # factors come from B <->H change
+    return H.reshape(len(inputs), -1, 3)
+
+
 @pytest.mark.parametrize(
-    "inputs, H_expected",
-    [[v["inputs"], v["H_expected"]] for v in DATA.values()],
+    "case, H_expected",
+    [[i, v["H_expected"]] for i, v in enumerate(DATA.values())],
     ids=list(DATA.keys()),
 )
-def test_cylinder_tile_slanovc(inputs, H_expected):
+def test_cylinder_tile_slanovc(cylinder_tile_H, case, H_expected):
     "testing precomputed cylinder test cases"
-    inputs_mod = {
-        "magnetizations": inputs["mag"],
-        "observers": inputs["obs_pos"],
-        "dimensions": inputs["dim"],
-    }
-    H = (
-        magnet_cylinder_segment_Hfield(**inputs_mod) / 4 / np.pi * 1e7
-    )  # factors come from B <->H change
-    np.testing.assert_allclose(H, H_expected)
+    np.testing.assert_allclose(cylinder_tile_H[case], H_expected)
+
+
+# full-cylinder reference data, with the cylinder dimensions (d,h) converted once
+#    to the equivalent cylinder segment dimensions (r1,r2,h,phi1,phi2)
+FULL_CYL_POL, FULL_CYL_DIM, FULL_CYL_OBS, FULL_CYL_B = np.load(
+    "tests/testdata/testdata_full_cyl.npy", mmap_mode="r"
+)
+FULL_CYL_DIM5 = np.zeros((len(FULL_CYL_DIM), 5))
+FULL_CYL_DIM5[:, 1] = FULL_CYL_DIM[:, 0] / 2
+FULL_CYL_DIM5[:, 2] = FULL_CYL_DIM[:, 1]
+FULL_CYL_DIM5[:, 4] = 360
 
 
 def test_cylinder_field1():
     """test the new cylinder field against old, full-cylinder
     implementations
     """
-    N = 100
-    magg, dim, poso, B0 = np.load("tests/testdata/testdata_full_cyl.npy")
-
-    nulll = np.zeros(N)
-    eins = np.ones(N)
-    d, h, _ = dim.T  # pylint: disable=no-member
-    dim5 = np.array([nulll, d / 2, h, nulll, eins * 360]).T
     B1 = BHJM_cylinder_segment(
-        field="B", observers=poso, polarization=magg, dimension=dim5
+        field="B",
+        observers=FULL_CYL_OBS,
+        polarization=FULL_CYL_POL,
+        dimension=FULL_CYL_DIM5,
     )
 
-    np.testing.assert_allclose(B1, B0)
+    np.testing.assert_allclose(B1, FULL_CYL_B)
 
 
 def test_cylinder_slanovc_field2():
@@ -242,40 +255,34 @@ def test_cylinder_slanovc_field2():
     b_out = (0.0177018, 0.1277188, 0.27323195)
     b_corn = (0, 0, 0)
 
-    # only inside
-    btest = np.array([b_in] * 3)
-    B = src.getB([r_in] * 3)
-    np.testing.assert_allclose(B, btest)
-
-    # only edge
-    btest = np.array([b_corn] * 3)
-    B = src.getB([r_corn] * 3)
-    np.testing.assert_allclose(B, btest)
-
-    # only outside
-    btest = np.array([b_out] * 3)
-    B = src.getB([r_out] * 3)
-    np.testing.assert_allclose(B, btest, rtol=1e-05, atol=1e-08)
-
-    # edge + out
-    btest = np.array([b_corn, b_corn, b_out])
-    B = src.getB([r_corn, r_corn, r_out])
-    np.testing.assert_allclose(B, btest, rtol=1e-05, atol=1e-08)
-
-    # surf + in
-    btest = np.array([b_corn, b_corn, b_in])
-    B = src.getB(r_corn, r_corn, r_in)
-    np.testing.assert_allclose(B, btest)
-
-    # in + out
-    btest = np.array([b_out, b_in])
-    B = src.getB(r_out, r_in)
-    np.testing.assert_allclose(B, btest, rtol=1e-05, atol=1e-08)
-
-    # in + out + surf
-    btest = np.array([b_corn, b_corn, b_in, b_out, b_corn, b_corn])
-    B = src.getB([r_corn, r_corn, r_in, r_out, r_corn, r_corn])
-    np.testing.assert_allclose(B, btest, rtol=1e-05, atol=1e-08)
+    # reference values outside are given to 8 digits only
+    tol_out = {"rtol": 1e-05, "atol": 1e-08}
+
+    # all combinations are computed in a single call and compared case by case
+    cases = [
+        # only inside
+        ([r_in] * 3, [b_in] * 3, {}),
+        # only edge
+        ([r_corn] * 3, [b_corn] * 3, {}),
+        # only outside
+        ([r_out] * 3, [b_out] * 3, tol_out),
+        # edge + out
+        ([r_corn, r_corn, r_out], [b_corn, b_corn, b_out], tol_out),
+        # surf + in
+        ([r_corn, r_corn, r_in], [b_corn, b_corn, b_in], {}),
+        # in + out
+        ([r_out, r_in], [b_out, b_in], tol_out),
+        # in + out + surf
+        (
+            [r_corn, r_corn, r_in, r_out, r_corn, r_corn],
+            [b_corn, b_corn, b_in, b_out, b_corn, b_corn],
+            tol_out,
+        ),
+    ]
+    B = src.getB(np.concatenate([obs for obs, _, _ in cases]))
+    splits = np.cumsum([len(obs) for obs, _, _ in cases])[:-1]
+    for b, (_, btest, tol) in zip(np.split(B, splits), cases):
+        np.testing.assert_allclose(b, btest, **tol)
 
 
 def test_cylinder_slanovc_field3():
@@ -288,47 +295,37 @@ def test_cylinder_slanovc_field3():
     hout = np.array((0.01408664, 0.1016354, 0.21743108)) * 1e6
     nulll = (0, 0, 0)
 
-    # only inside
-    htest = np.array([hinn] * 3)
-    H = src.getH([[0.5, 0.6, 0.3]] * 3)
-    np.testing.assert_allclose(H, htest)
-
-    # only surf
-    htest = np.array([nulll] * 3)
-    H = src.getH([[1, 0, 0]] * 3)
-    np.testing.assert_allclose(H, htest)
-
-    # only outside
-    htest = np.array([hout] * 3)
-    H = src.getH([[1, 2, 3]] * 3)
-    np.testing.assert_allclose(H, htest)
-
-    # surf + out
-    htest = np.array([nulll, nulll, hout])
-    H = src.getH([0.6, 0, 1], [1, 0, 0.5], [1, 2, 3])
-    np.testing.assert_allclose(H, htest)
-
-    # surf + in
-    htest = np.array([nulll, nulll, hinn])
-    H = src.getH([0, 0.5, 1], [1, 0, 0.5], [0.5, 0.6, 0.3])
-    np.testing.assert_allclose(H, htest)
-
-    # in + out
-    htest = np.array([hout, hinn])
-    H = src.getH([1, 2, 3], [0.5, 0.6, 0.3])
-    np.testing.assert_allclose(H, htest)
-
-    # in + out + surf
-    htest = np.array([nulll, nulll, hinn, hout, nulll, nulll])
-    H = src.getH(
-        [0.5, 0.5, 1],
-        [0, 1, 0.5],
-        [0.5, 0.6, 0.3],
-        [1, 2, 3],
-        [0.5, 0.6, -1],
-        [0, 1, -0.3],
-    )
-    np.testing.assert_allclose(H, htest)
+    # all combinations are computed in a single call and compared case by case
+    cases = [
+        # only inside
+        ([[0.5, 0.6, 0.3]] * 3, [hinn] * 3),
+        # only surf
+        ([[1, 0, 0]] * 3, [nulll] * 3),
+        # only outside
+        ([[1, 2, 3]] * 3, [hout] * 3),
+        # surf + out
+        ([[0.6, 0, 1], [1, 0, 0.5], [1, 2, 3]], [nulll, nulll, hout]),
+        # surf + in
+        ([[0, 0.5, 1], [1, 0, 0.5], [0.5, 0.6, 0.3]], [nulll, nulll, hinn]),
+        # in + out
+        ([[1, 2, 3], [0.5, 0.6, 0.3]], [hout, hinn]),
+        # in + out + surf
+        (
+            [
+                [0.5, 0.5, 1],
+                [0, 1, 0.5],
+                [0.5, 0.6, 0.3],
+                [1, 2, 3],
+                [0.5, 0.6, -1],
+                [0, 1, -0.3],
+            ],
+            [nulll, nulll, hinn, hout, nulll, nulll],
+        ),
+    ]
+    H = src.getH(np.concatenate([obs for obs, _ in cases]))
+    splits = np.cumsum([len(obs) for obs, _ in cases])[:-1]
+    for h, (_, htest) in zip(np.split(H, splits), cases):
+        np.testing.assert_allclose(h, htest)
 
 
 def test_cylinder_rauber_field4():
@@ -359,7 +356,9 @@ def test_cylinder_tile_negative_phi():
 
 def test_cylinder_tile_vs_fem():
     """test against fem results"""
-    fd1, fd2, fd3, fd4 = np.load("tests/testdata/testdata_femDat_cylinder_tile2.npy")
+    fd1, fd2, fd3, fd4 = np.load(
+        "tests/testdata/testdata_femDat_cylinder_tile2.npy", mmap_mode="r"
+    )
 
     # chosen magnetization vectors
     mag1 = np.array((1, -1, 0)) / np.sqrt(2) * 1000
@@ -384,10 +383,10 @@ def test_cylinder_tile_vs_fem():
     # create observer circles (see FEM screen shot)
     n = 101
     ts = np.linspace(0, 359.999, n) * np.pi / 180
-    poso1 = np.array([0.5 * np.cos(ts), 0.5 * np.sin(ts), np.zeros(n)]).T
-    poso2 = np.array([1.5 * np.cos(ts), 1.5 * np.sin(ts), np.zeros(n)]).T
-    poso3 = np.array([1.5 * np.cos(ts), 1.5 * np.sin(ts), np.ones(n)]).T
-    poso4 = np.array([3.5 * np.cos(ts), 3.5 * np.sin(ts), np.zeros(n)]).T
+    poso1 = np.column_stack([0.5 * np.cos(ts), 0.5 * np.sin(ts), np.zeros(n)])
+    poso2 = np.column_stack([1.5 * np.cos(ts), 1.5 * np.sin(ts), np.zeros(n)])
+    poso3 = np.column_stack([1.5 * np.cos(ts), 1.5 * np.sin(ts), np.ones(n)])
+    poso4 = np.column_stack([3.5 * np.cos(ts), 3.5 * np.sin(ts), np.zeros(n)])
 
     # compute and plot fields
     B1 = col.getB(poso1)
@@ -11,24 +11,36 @@ def test_Tetrahedron_repr():
     assert repr(tetra)[:11] == "Tetrahedron", "Tetrahedron repr failed"
 
 
-def test_tetra_input():
-    """test obj-oriented triangle vs cube"""
-    obs = (1, 2, 3)
-    pol = (111, 222, 333)
-    vert_list = [
+# vertices of six tetrahedra that fill up the cube [-1,1]^3, shape (6,4,3)
+VERTS = np.array(
+    [
         [(1, 1, -1), (1, 1, 1), (-1, 1, 1), (1, -1, 1)],
         [(-1, -1, 1), (-1, 1, 1), (1, -1, 1), (1, -1, -1)],
         [(-1, -1, -1), (-1, -1, 1), (-1, 1, -1), (1, -1, -1)],
         [(-1, 1, -1), (1, -1, -1), (-1, -1, 1), (-1, 1, 1)],
         [(1, -1, -1), (1, 1, -1), (1, -1, 1), (-1, 1, 1)],
         [(-1, 1, -1), (-1, 1, 1), (1, 1, -1), (1, -1, -1)],
-    ]
+    ],
+    dtype=float,
+)
 
+
+@pytest.fixture(scope="module")
+def tetra_cube_pair():
+    """Collection of six tetrahedra that fill up a cube, and the same cube"""
+    pol = (111, 222, 333)
     coll = magpy.Collection()
-    for v in vert_list:
+    for v in VERTS:
         coll.add(magpy.magnet.Tetrahedron(polarization=pol, vertices=v))
 
     cube = magpy.magnet.Cuboid(polarization=pol, dimension=(2, 2, 2))
+    return coll, cube
+
+
+def test_tetra_input(tetra_cube_pair):
+    """test obj-oriented triangle vs cube"""
+    obs = (1, 2, 3)
+    coll, cube = tetra_cube_pair
 
     b = coll.getB(obs)
     bb = cube.getB(obs)
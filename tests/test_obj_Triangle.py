@@ -1,8 +1,12 @@
+from unittest.mock import patch
+
 import numpy as np
+import pytest
 
 import magpylib as magpy
 from magpylib._src.exceptions import MagpylibMissingInput
 from magpylib._src.fields.field_BH_triangle import BHJM_triangle
+from magpylib._src.fields.field_BH_triangle import triangle_Bfield_mesh
 
 
 def test_Triangle_repr():
@@ -79,3 +83,86 @@ def test_Triangle_barycenter():
     face = magpy.misc.Triangle(polarization=pol, vertices=vert)
     bary = np.array([0, 0, 0])
     np.testing.assert_allclose(face.barycenter, bary)
+
+
+def test_triangle_core_single_triangle_broadcast():
+    """single triangle core input is broadcast against all observers"""
+    obs = np.array([(3, 4, 5), (0.1, 0.2, 0.3), (-1, 2, -3), (0, 0, 0)])
+    pol = np.array((111, 222, 333))
+    vert = np.array([(0, 0, 0), (3, 0, 0), (0, 10, 0)])
+
+    b1 = magpy.core.triangle_Bfield(observers=obs, vertices=vert, polarizations=pol)
+    b2 = magpy.core.triangle_Bfield(
+        observers=obs,
+        vertices=np.tile(vert, (4, 1, 1)),
+        polarizations=np.tile(pol, (4, 1)),
+    )
+    np.testing.assert_allclose(b1, b2, equal_nan=True)
+
+
+def test_triangle_core_batch_axes():
+    """leading batch axes are flattened and restored"""
+    rng = np.random.default_rng(0)
+    obs = rng.random((4, 5, 3)) * 4 - 2
+    pol = rng.random((4, 5, 3))
+    vert = rng.random((4, 5, 3, 3))
+
+    b1 = magpy.core.triangle_Bfield(observers=obs, vertices=vert, polarizations=pol)
+    b2 = magpy.core.triangle_Bfield(
+        observers=obs.reshape(-1, 3),
+        vertices=vert.reshape(-1, 3, 3),
+        polarizations=pol.reshape(-1, 3),
+    )
+    assert b1.shape == (4, 5, 3)
+    np.testing.assert_allclose(b1.reshape(-1, 3), b2)
+
+    b3 = magpy.core.triangle_Bfield(
+        observers=obs, vertices=vert[0, 0], polarizations=pol[0, 0]
+    )
+    assert b3.shape == (4, 5, 3)
+
+
+@pytest.mark.parametrize("n", [1, 6, 7, 8, 14, 15, 20])
+def test_triangle_core_chunks(n):
+    """chunked evaluation matches the unchunked one at exact multiples of the chunk
+    size and with remainders"""
+    rng = np.random.default_rng(n)
+    obs = rng.random((n, 3)) * 4 - 2
+    pol = rng.random((n, 3))
+    vert = rng.random((n, 3, 3))
+    mesh = rng.random((3, 3, 3))
+
+    b_pairs = magpy.core.triangle_Bfield(
+        observers=obs, vertices=vert, polarizations=pol
+    )
+    b_single = magpy.core.triangle_Bfield(
+        observers=obs, vertices=vert[0], polarizations=pol[0]
+    )
+    b_mesh = triangle_Bfield_mesh(obs, mesh, pol)
+    with patch("magpylib._src.fields.field_BH_triangle._CHUNK_SIZE", 7):
+        np.testing.assert_allclose(
+            magpy.core.triangle_Bfield(observers=obs, vertices=vert, polarizations=pol),
+            b_pairs,
+        )
+        np.testing.assert_allclose(
+            magpy.core.triangle_Bfield(
+                observers=obs, vertices=vert[0], polarizations=pol[0]
+            ),
+            b_single,
+        )
+        # 3 triangles per observer give chunks of 2 observers
+        np.testing.assert_allclose(triangle_Bfield_mesh(obs, mesh, pol), b_mesh)
+
+
+def test_triangle_core_single_polarization():
+    """a single triangle accepts one polarization of shape (3,) or (1,3) only"""
+    obs = np.array([(1, 2, 3), (-1, 0.5, 2)])
+    vert = np.array([(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+    pol = np.array([0.1, 0.2, 0.3])
+    np.testing.assert_allclose(
+        magpy.core.triangle_Bfield(obs, vert, pol[np.newaxis]),
+        magpy.core.triangle_Bfield(obs, vert, pol),
+    )
+    for bad in (np.ones((3, 3)), np.ones((len(obs), 3))):
+        with pytest.raises(ValueError, match=r"requires `polarizations` of shape"):
+            magpy.core.triangle_Bfield(obs, vert, bad)
@@ -9,9 +9,17 @@ import pyvista as pv
 
 import magpylib as magpy
 from magpylib._src.exceptions import MagpylibBadUserInput
+from magpylib._src.fields.field_BH_triangle import triangle_Bfield
+from magpylib._src.fields.field_BH_triangle import triangle_Bfield_mesh
 from magpylib._src.fields.field_BH_triangularmesh import BHJM_magnet_trimesh
 from magpylib._src.fields.field_BH_triangularmesh import fix_trimesh_orientation
+from magpylib._src.fields.field_BH_triangularmesh import get_disconnected_faces_subsets
+from magpylib._src.fields.field_BH_triangularmesh import get_mesh_groups
+from magpylib._src.fields.field_BH_triangularmesh import get_open_edges
+from magpylib._src.fields.field_BH_triangularmesh import get_unique_vertices
+from magpylib._src.fields.field_BH_triangularmesh import is_trimesh_connected
 from magpylib._src.fields.field_BH_triangularmesh import lines_end_in_trimesh
+from magpylib._src.fields.field_BH_triangularmesh import mask_inside_trimesh
 
 
 def test_TriangularMesh_repr():
@@ -164,6 +172,30 @@ def test_bad_triangle_indices():
         )
 
 
+def test_triangle_indices_int_array():
+    """integer faces arrays are checked for shape and bounds without float conversion"""
+    vertices = [[0, 0, 0], [0, 0, 1], [1, 0, 0], [0, 1, 0]]
+    kw = {"polarization": (0, 0, 1), "vertices": vertices, "check_open": "ignore"}
+    kw.update(check_disconnected="ignore", check_selfintersecting="ignore")
+    faces = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.intp)
+    tmesh = magpy.magnet.TriangularMesh(faces=faces, reorient_faces=False, **kw)
+    assert tmesh.faces.dtype == np.intp
+    np.testing.assert_array_equal(tmesh.faces, faces)
+
+    # the input array is copied, mutating it later leaves the magnet untouched
+    mesh = tmesh.mesh.copy()
+    faces[0] = (1, 2, 3)
+    np.testing.assert_array_equal(tmesh.faces, [[0, 1, 2], [0, 2, 3]])
+    np.testing.assert_array_equal(tmesh.mesh, mesh)
+
+    with pytest.raises(IndexError):
+        magpy.magnet.TriangularMesh(faces=np.array([[0, 1, 4]]), **kw)
+    with pytest.raises(IndexError):
+        magpy.magnet.TriangularMesh(faces=np.array([[0, 1, -5]]), **kw)
+    with pytest.raises(MagpylibBadUserInput):
+        magpy.magnet.TriangularMesh(faces=np.array([[0, 1, 2, 3]]), **kw)
+
+
 def test_open_mesh():
     """raises Error if mesh is open"""
     open_mesh = {
@@ -485,3 +517,283 @@ def test_orientation_edge_case():
     )
 
     np.testing.assert_array_equal(cone1.faces, cone2.faces)
+
+
+def test_get_unique_vertices():
+    """byte-key dedup must find the same vertices as np.unique along axis 0"""
+    rng = np.random.default_rng(0)
+    verts = rng.random((50, 3))
+    verts[0] = (0, 0, 0)
+    points = verts[rng.integers(0, 50, 300)]
+    points = np.concatenate([points, [(-0.0, 0.0, -0.0)]])
+
+    vertices, inverse = get_unique_vertices(points)
+    vertices2 = np.unique(points, axis=0)
+    assert len(vertices) == len(vertices2)
+    np.testing.assert_array_equal(np.unique(vertices, axis=0), vertices2)
+    np.testing.assert_array_equal(vertices[inverse], points)
+    # vertices keep the order of their first occurrence in the input
+    _, first = np.unique(inverse, return_index=True)
+    assert np.all(np.diff(first) > 0)
+
+
+def test_TriangularMesh_mesh_cache():
+    """mesh is cached and rebuilt only when the faces are replaced"""
+    tmesh = magpy.magnet.TriangularMesh.from_pyvista(
+        polarization=(0, 0, 1), polydata=pv.Octahedron()
+    )
+    mesh = tmesh.mesh
+    assert tmesh.mesh is mesh
+    assert not mesh.flags.writeable
+    np.testing.assert_array_equal(mesh, tmesh.vertices[tmesh.faces])
+
+    tmesh._faces = tmesh._faces[:, ::-1]  # pylint: disable=protected-access
+    assert tmesh.mesh is not mesh
+    np.testing.assert_array_equal(tmesh.mesh, tmesh.vertices[tmesh.faces])
+
+
+def test_TriangularMesh_mesh_cache_inplace_edit():
+    """vertices and faces are read-only, so the cached mesh cannot go stale"""
+    tmesh = magpy.magnet.TriangularMesh.from_pyvista(
+        polarization=(0, 0, 1), polydata=pv.Octahedron()
+    )
+    obs = (1, 2, 3)
+    B = tmesh.getB(obs)
+    with pytest.raises(ValueError, match="read-only"):
+        tmesh.vertices[0] += 1
+    with pytest.raises(ValueError, match="read-only"):
+        tmesh.faces[0] = tmesh.faces[0, ::-1]
+    np.testing.assert_array_equal(tmesh.getB(obs), B)
+    np.testing.assert_array_equal(tmesh.mesh, tmesh.vertices[tmesh.faces])
+
+    tmesh.reorient_faces()
+    assert not tmesh.faces.flags.writeable
+
+
+def test_TriangularMesh_barycenter_cache():
+    """cached centroid follows position, orientation and faces changes"""
+    tmesh = magpy.magnet.TriangularMesh.from_pyvista(
+        polarization=(0, 0, 1), polydata=pv.Cube(center=(1, 2, 3))
+    )
+    np.testing.assert_allclose(tmesh.barycenter, (1, 2, 3), atol=1e-12)
+    tmesh.move((1, 1, 1))
+    tmesh.rotate_from_angax(90, "z", anchor=0)
+    np.testing.assert_allclose(tmesh.barycenter, (-3, 2, 4), atol=1e-12)
+
+    # in-place edits are rejected instead of leaving a stale centroid behind
+    with pytest.raises(ValueError, match="read-only"):
+        tmesh.vertices[:] += 1
+    np.testing.assert_allclose(tmesh.barycenter, (-3, 2, 4), atol=1e-12)
+
+    # pylint: disable=protected-access
+    tmesh._faces = tmesh._faces[:2]
+    centroid = np.mean(tmesh.vertices[tmesh.faces[:2]].reshape(-1, 3), axis=0)
+    np.testing.assert_allclose(tmesh._centroid, centroid)
+
+
+def test_TriangularMesh_to_TriangleCollection_path():
+    """TriangleCollection of a mesh with a path gives the same field"""
+    tmesh = magpy.magnet.TriangularMesh.from_pyvista(
+        polarization=(0.1, 0.2, 1), polydata=pv.Icosahedron()
+    )
+    tmesh.move([(1, 2, 3), (2, 3, 4)])
+    tmesh.rotate_from_rotvec([(10, 20, 30), (30, 10, 0)], anchor=(0, 1, 0))
+    coll = tmesh.to_TriangleCollection()
+
+    obs = [(5, 6, 7), (1, 1, 1)]
+    np.testing.assert_allclose(coll.getB(obs), tmesh.getB(obs))
+    for tri in coll:
+        np.testing.assert_allclose(tri.position, tmesh.position)
+        np.testing.assert_allclose(tri.magnetization, tmesh.magnetization)
+
+    # children do not share their polarization array with each other or the mesh
+    coll[0].polarization[:] = 0
+    np.testing.assert_allclose(coll[1].polarization, (0.1, 0.2, 1))
+    np.testing.assert_allclose(tmesh.polarization, (0.1, 0.2, 1))
+
+
+def test_triangle_Bfield_mesh():
+    """broadcast mesh evaluation must match the tiled pairwise evaluation"""
+    rng = np.random.default_rng(0)
+    obs = rng.random((7, 3)) * 4 - 2
+    pol = rng.random((7, 3))
+    vert = rng.random((5, 3, 3))
+
+    b1 = triangle_Bfield_mesh(observers=obs, vertices=vert, polarizations=pol)
+    b2 = triangle_Bfield(
+        observers=np.repeat(obs, 5, axis=0),
+        vertices=np.tile(vert, (7, 1, 1)),
+        polarizations=np.repeat(pol, 5, axis=0),
+    )
+    np.testing.assert_allclose(b1, b2.reshape(7, 5, 3).sum(axis=1))
+
+
+def test_get_mesh_groups():
+    """runs of consecutive identical meshes"""
+    m0, m1 = np.zeros((2, 3, 3)), np.ones((2, 3, 3))
+    mesh = np.array([m0, m0, m1, m0])
+    assert get_mesh_groups(mesh) == [(0, 2), (2, 3), (3, 4)]
+
+    mesh = np.empty(3, dtype=object)
+    mesh[:] = [m0, np.zeros((4, 3, 3)), np.zeros((4, 3, 3))]
+    assert get_mesh_groups(mesh) == [(0, 1), (1, 3)]
+
+
+def test_BHJM_magnet_trimesh_small_and_large_groups():
+    """small groups evaluated in the tiled call and large groups evaluated with
+    broadcasting give the face-wise summed field, for equal and ragged meshes"""
+    rng = np.random.default_rng(0)
+    small, large = rng.random((4, 3, 3)), rng.random((600, 3, 3))
+    obs = rng.random((11, 3)) * 4 - 2
+    pol = rng.random((11, 3))
+
+    def summed(meshes):
+        return np.array(
+            [
+                triangle_Bfield(
+                    np.tile(o, (len(m), 1)), m, np.tile(p, (len(m), 1))
+                ).sum(axis=0)
+                for o, m, p in zip(obs, meshes, pol)
+            ]
+        )
+
+    # ragged: one large group, then singletons and a run of small meshes
+    meshes = [large] * 5 + [small, small * 2] + [small] * 4
+    mesh = np.empty(11, dtype=object)
+    mesh[:] = meshes
+    B = BHJM_magnet_trimesh("B", obs, mesh, pol, in_out="outside")
+    np.testing.assert_allclose(B, summed(meshes))
+
+    # equal number of faces, all groups small
+    meshes = [small] * 3 + [small * 2] * 8
+    B = BHJM_magnet_trimesh("B", obs, np.array(meshes), pol, in_out="outside")
+    np.testing.assert_allclose(B, summed(meshes))
+
+
+def test_BHJM_magnet_trimesh_small_groups_inside():
+    """the inside check of small groups, done in one call with one mesh per
+    observer, matches the check of each observer against its own mesh"""
+    rng = np.random.default_rng(0)
+    tetra = np.array([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)], dtype=float)
+    faces = np.array([(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)])
+    meshes = [(tetra + rng.random(3) * 0.5)[faces] for _ in range(6)]
+    meshes = [meshes[i] for i in (0, 0, 1, 2, 2, 2, 3, 4, 5, 5)]
+    obs = rng.random((10, 3)) * 1.2
+    pol = rng.random((10, 3))
+    inside = [mask_inside_trimesh(o[np.newaxis], m)[0] for o, m in zip(obs, meshes)]
+    assert 0 < sum(inside) < 10
+
+    J = BHJM_magnet_trimesh("J", obs, np.array(meshes), pol, in_out="auto")
+    np.testing.assert_array_equal(J, pol * np.array(inside)[:, np.newaxis])
+
+
+def test_get_open_edges():
+    """edge-key counting must match unique edge pairs with counts != 2"""
+    rng = np.random.default_rng(0)
+    for faces in (rng.integers(0, 30, (40, 3)), rng.integers(-15, 15, (40, 3))):
+        edges = np.concatenate([faces[:, 0:2], faces[:, 1:3], faces[:, ::2]])
+        edges_uniq, counts = np.unique(
+            np.sort(edges, axis=1), axis=0, return_counts=True
+        )
+        np.testing.assert_array_equal(get_open_edges(faces), edges_uniq[counts != 2])
+
+    closed = np.array([(0, 1, 2), (0, 3, 1), (1, 3, 2), (0, 2, 3)])
+    assert get_open_edges(closed).shape == (0, 2)
+
+
+def test_get_disconnected_faces_subsets():
+    """subsets are ordered by their first face and keep the faces order"""
+    faces = np.array([(0, 1, 2), (3, 4, 5), (2, 6, 7), (8, 9, 10), (5, 11, 12)])
+    subsets = get_disconnected_faces_subsets(faces)
+    assert len(subsets) == 3
+    np.testing.assert_array_equal(subsets[0], faces[[0, 2]])
+    np.testing.assert_array_equal(subsets[1], faces[[1, 4]])
+    np.testing.assert_array_equal(subsets[2], faces[[3]])
+
+    assert not is_trimesh_connected(faces)
+    assert is_trimesh_connected(faces[[0, 2]])
+
+
+def test_status_disconnected_data_connected():
+    """the single subset of a connected mesh cannot be used to edit its faces"""
+    tmesh = magpy.magnet.TriangularMesh.from_pyvista(
+        polarization=(0, 0, 1), polydata=pv.Octahedron()
+    )
+    (subset,) = tmesh.status_disconnected_data
+    np.testing.assert_array_equal(subset, tmesh.faces)
+    with pytest.raises(ValueError, match="read-only"):
+        subset[0] = 0
+
+
+def test_fix_trimesh_orientation_shuffled():
+    """randomly flipped and shuffled faces of a sphere are all reoriented outwards"""
+    rng = np.random.default_rng(0)
+    sphere = pv.Sphere(theta_resolution=20, phi_resolution=20).triangulate()
+    vertices = np.array(sphere.points, dtype=float)
+    faces = sphere.regular_faces[rng.permutation(sphere.n_cells)]
+    flip = rng.random(len(faces)) < 0.5
+    faces[flip] = faces[flip][:, [0, 2, 1]]
+
+    faces = fix_trimesh_orientation(vertices, faces)
+    tri = vertices[faces]
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    assert np.all(np.sum(normals * tri.mean(axis=1), axis=1) > 0)
+
+
+def test_from_ConvexHull_orientation():
+    """hull faces are oriented outwards without a reorient_faces pass"""
+    points = np.random.default_rng(0).normal(size=(200, 3))
+    with patch(
+        "magpylib._src.obj_classes.class_magnet_TriangularMesh.fix_trimesh_orientation"
+    ) as fix:
+        magnet = magpy.magnet.TriangularMesh.from_ConvexHull(
+            polarization=(0, 0, 1), points=points
+        )
+    fix.assert_not_called()
+    assert magnet.status_reoriented
+
+    tri = magnet.mesh
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    centroid = magnet.vertices.mean(axis=0)
+    assert np.all(np.sum(normals * (tri.mean(axis=1) - centroid), axis=1) > 0)
+
+
+def test_TriangularMesh_to_TriangleCollection_style():
+    """the mesh style is only created and copied if it has been set"""
+    # pylint: disable=protected-access
+    tmesh = magpy.magnet.TriangularMesh.from_pyvista(
+        polarization=(0.1, 0.2, 1), polydata=pv.Icosahedron()
+    )
+    tmesh.to_TriangleCollection()
+    assert getattr(tmesh, "_style", None) is None
+
+    tmesh = magpy.magnet.TriangularMesh.from_pyvista(
+        polarization=(0.1, 0.2, 1),
+        polydata=pv.Icosahedron(),
+        style_color="red",
+        style_label="ico",
+    )
+    coll = tmesh.to_TriangleCollection()
+    assert coll.style.color == "red"
+    assert coll.style.label == "ico"
+
+
+def test_from_ConvexHull_status():
+    """hull statuses are set without running the checks, unless a check is skipped"""
+    points = np.random.default_rng(0).normal(size=(50, 3))
+    kw = {"polarization": (0, 0, 1), "points": points}
+    magnet = magpy.magnet.TriangularMesh.from_ConvexHull(**kw)
+    assert magnet.status_open is False
+    assert magnet.status_open_data.shape == (0, 2)
+    assert magnet.status_disconnected is False
+    assert len(magnet.status_disconnected_data) == 1
+
+    magnet = magpy.magnet.TriangularMesh.from_ConvexHull(
+        check_open="skip", check_disconnected="skip", reorient_faces=False, **kw
+    )
+    assert magnet.status_open is None
+    assert magnet.status_disconnected is None
+    assert magnet.status_reoriented is False
+
+    with pytest.raises(ValueError):
+        magpy.magnet.TriangularMesh.from_ConvexHull(check_open="bad", **kw)